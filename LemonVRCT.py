@@ -9,9 +9,26 @@ Directly launches the main program and provides configuration interface options
 
 import os
 import sys
-import threading
 import time
 
+# 控制菜单文本，一次写入控制台
+MENU_TEXT = (
+    "\n" + "=" * 30 + "\n"
+    "Control Menu / 控制菜单\n"
+    + "=" * 30 + "\n"
+    "1. Start Main Program / 启动主程序\n"
+    "2. Open Configuration Interface / 打开配置界面\n"
+    "3. Exit / 退出\n"
+)
+
+def preload_main_program():
+    """后台预加载主程序模块 / Preload main program module in background"""
+    try:
+        import vrchat_translator
+    except Exception:
+        # 预加载失败时忽略，启动主程序时会再次导入并报告错误
+        pass
+
 def main():
     """主启动函数 / Main launcher function"""
     print("=" * 50)
@@ -19,18 +36,18 @@ def main():
     print("VRChat语音翻译软件")
     print("=" * 50)
     
+    # 在用户阅读菜单时预加载主程序的重量级依赖
+    import threading
+    threading.Thread(target=preload_main_program, daemon=True).start()
+    
     # 显示菜单
     show_menu()
 
 def show_menu():
     """显示菜单 / Show menu"""
     while True:
-        print("\n" + "=" * 30)
-        print("Control Menu / 控制菜单")
-        print("=" * 30)
-        print("1. Start Main Program / 启动主程序")
-        print("2. Open Configuration Interface / 打开配置界面")
-        print("3. Exit / 退出")
+        sys.stdout.write(MENU_TEXT)
+        sys.stdout.flush()
         
         try:
             choice = input("\nPlease enter your choice (1-3): / 请输入选择 (1-3): ").strip()
@@ -54,27 +71,27 @@ def start_main_program():
     """启动主程序 / Start main program"""
     print("Starting main program... / 正在启动主程序...")
     try:
-        # 直接导入并运行主程序
+        # 直接导入并创建主程序 (通常已由后台线程预加载)
         import vrchat_translator
         translator = vrchat_translator.VRChatTranslator()
-        
-        # 在新线程中运行主程序
-        def run_translator():
-            try:
-                translator.run()
-            except Exception as e:
-                print(f"Main program error: {e} / 主程序错误: {e}")
-        
-        thread = threading.Thread(target=run_translator, daemon=True)
-        thread.start()
-        
-        print("✓ Main program started / 主程序已启动")
-        print("✓ Press K to start recording, release K to stop and translate / 按K键开始录音，松开K键停止并翻译")
-        print("✓ Program is running in background / 程序正在后台运行")
-        
     except Exception as e:
         print(f"✗ Failed to start main program: {e} / 启动主程序失败: {e}")
         print("Please ensure all dependencies are installed / 请确保已安装所有依赖包")
+        return
+    
+    print("✓ Main program started / 主程序已启动")
+    print("✓ Press K to start recording, release K to stop and translate / 按K键开始录音，松开K键停止并翻译")
+    print("✓ Press Ctrl+C to stop and return to menu / 按Ctrl+C停止并返回菜单")
+    
+    # 在主线程中运行主程序，退出后返回菜单
+    try:
+        translator.run()
+    except KeyboardInterrupt:
+        print("\nMain program stopped / 主程序已停止")
+    except Exception as e:
+        print(f"Main program error: {e} / 主程序错误: {e}")
+    finally:
+        translator.cleanup()
 
 def open_config_gui():
     """打开配置界面 / Open configuration interface"""
@@ -9,121 +9,143 @@ Uses standard tkinter to avoid compatibility issues
 使用标准tkinter，避免兼容性问题
 """
 
-import ttkbootstrap as tk
-from tkinter import ttk, messagebox, scrolledtext
 import os
+import re
 import sys
-import io
-from dotenv import load_dotenv
 import time
+from types import MappingProxyType
 
 # 设置系统编码为UTF-8
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+# 原地重新配置而不是重建TextIOWrapper；pythonw下stdout可能为None，直接跳过
+os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+for _stream in (sys.stdout, sys.stderr):
+    try:
+        _stream.reconfigure(encoding='utf-8')
+    except (AttributeError, ValueError):
+        pass
+
+# GUI模块延迟导入，避免启动器在未打开配置界面时加载tkinter/ttkbootstrap
+tk = None
+ttk = None
+scrolledtext = None
+
+def import_gui_modules():
+    """按需导入GUI模块 / Import GUI modules on demand"""
+    global tk, ttk, scrolledtext
+    if tk is None:
+        import ttkbootstrap as tk
+        from tkinter import ttk, scrolledtext
 
-# 加载环境变量
-load_dotenv()
+# .env行格式: KEY=VALUE，注释行和空行不匹配；只允许空格/制表符，避免空值跨行匹配
+ENV_LINE_RE = re.compile(r'(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+# 界面下拉框/复选框选项
+SOURCE_LANGUAGES = ("zh", "en", "ja", "ko", "fr", "de", "es", "ru")
+TARGET_LANGUAGES = ("en", "ja", "ko", "fr", "de", "es", "ru")
+WHISPER_MODELS = ("tiny", "base", "small", "medium", "large-v3", "large-v3-turbo")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
 # 双语文本定义
 class BilingualText:
     """双语文本管理器"""
+    _TEXTS = {
+        "zh": MappingProxyType({
+            # 窗口标题
+            "window_title": "VRChat语音翻译软件 - 配置界面",
+            # 框架标题
+            "config_frame": "配置设置",
+            "log_frame": "操作日志",
+            # 标签文本
+            "source_language": "源语言:",
+            "target_languages": "目标语言:",
+            "microphone_device": "麦克风设备:",
+            "whisper_model": "Whisper模型:",
+            "api_url": "API链接:",
+            "api_key": "API密钥:",
+            "api_model": "模型:",
+            "osc_address": "OSC地址:",
+            "osc_port": "端口:",
+            "hotkey": "快捷键:",
+            "audio_chunk": "音频块大小:",
+            "audio_rate": "采样率:",
+            "audio_channels": "声道数:",
+            "log_level": "日志级别:",
+            # 按钮文本
+            "save_config": "保存配置",
+            "reload_config": "重新加载",
+            "reset_default": "重置默认",
+            "clear_logs": "清空日志",
+            # 设备选项
+            "device_options": ("0: 默认设备", "1: 系统默认", "2: 主麦克风"),
+            # 日志消息
+            "interface_started": "配置界面已启动",
+            "config_loaded": "配置已加载到界面",
+            "config_saved": "配置已保存到.env文件，请完全退出该程序重新加载",
+            "config_save_failed": "保存配置失败",
+            "default_reset": "已重置为默认配置",
+            # 消息框
+            "success": "成功",
+            "error": "错误",
+            "confirm": "确认",
+            "reset_confirm": "确定要重置为默认配置吗？"
+        }),
+        "en": MappingProxyType({
+            # 窗口标题
+            "window_title": "VRChat Voice Translation Software - Configuration Interface",
+            # 框架标题
+            "config_frame": "Configuration Settings",
+            "log_frame": "Operation Log",
+            # 标签文本
+            "source_language": "Source Language:",
+            "target_languages": "Target Languages:",
+            "microphone_device": "Microphone Device:",
+            "whisper_model": "Whisper Model:",
+            "api_url": "API URL:",
+            "api_key": "API Key:",
+            "api_model": "Model:",
+            "osc_address": "OSC Address:",
+            "osc_port": "Port:",
+            "hotkey": "Hotkey:",
+            "audio_chunk": "Audio Chunk Size:",
+            "audio_rate": "Sample Rate:",
+            "audio_channels": "Channels:",
+            "log_level": "Log Level:",
+            # 按钮文本
+            "save_config": "Save Configuration",
+            "reload_config": "Reload",
+            "reset_default": "Reset Default",
+            "clear_logs": "Clear Logs",
+            # 设备选项
+            "device_options": ("0: Default Device", "1: System Default", "2: Primary Microphone"),
+            # 日志消息
+            "interface_started": "Configuration interface started",
+            "config_loaded": "Configuration loaded to interface",
+            "config_saved": "Configuration saved to .env file.Please completely exit the program and reload it.",
+            "config_save_failed": "Failed to save configuration",
+            "default_reset": "Default configuration reset",
+            # 消息框
+            "success": "Success",
+            "error": "Error",
+            "confirm": "Confirm",
+            "reset_confirm": "Are you sure you want to reset to default configuration?"
+        })
+    }
+    
     def __init__(self):
         self.current_language = "zh"  # 默认中文
-        self.texts = {
-            "zh": {
-                # 窗口标题
-                "window_title": "VRChat语音翻译软件 - 配置界面",
-                # 框架标题
-                "config_frame": "配置设置",
-                "log_frame": "操作日志",
-                # 标签文本
-                "source_language": "源语言:",
-                "target_languages": "目标语言:",
-                "microphone_device": "麦克风设备:",
-                "whisper_model": "Whisper模型:",
-                "api_url": "API链接:",
-                "api_key": "API密钥:",
-                "api_model": "模型:",
-                "osc_address": "OSC地址:",
-                "osc_port": "端口:",
-                "hotkey": "快捷键:",
-                "audio_chunk": "音频块大小:",
-                "audio_rate": "采样率:",
-                "audio_channels": "声道数:",
-                "log_level": "日志级别:",
-                # 按钮文本
-                "save_config": "保存配置",
-                "reload_config": "重新加载",
-                "reset_default": "重置默认",
-                "clear_logs": "清空日志",
-                # 设备选项
-                "device_options": ["0: 默认设备", "1: 系统默认", "2: 主麦克风"],
-                # 日志消息
-                "interface_started": "配置界面已启动",
-                "config_loaded": "配置已加载到界面",
-                "config_saved": "配置已保存到.env文件，请完全退出该程序重新加载",
-                "config_save_failed": "保存配置失败",
-                "default_reset": "已重置为默认配置",
-                # 消息框
-                "success": "成功",
-                "error": "错误",
-                "confirm": "确认",
-                "reset_confirm": "确定要重置为默认配置吗？"
-            },
-            "en": {
-                # 窗口标题
-                "window_title": "VRChat Voice Translation Software - Configuration Interface",
-                # 框架标题
-                "config_frame": "Configuration Settings",
-                "log_frame": "Operation Log",
-                # 标签文本
-                "source_language": "Source Language:",
-                "target_languages": "Target Languages:",
-                "microphone_device": "Microphone Device:",
-                "whisper_model": "Whisper Model:",
-                "api_url": "API URL:",
-                "api_key": "API Key:",
-                "api_model": "Model:",
-                "osc_address": "OSC Address:",
-                "osc_port": "Port:",
-                "hotkey": "Hotkey:",
-                "audio_chunk": "Audio Chunk Size:",
-                "audio_rate": "Sample Rate:",
-                "audio_channels": "Channels:",
-                "log_level": "Log Level:",
-                # 按钮文本
-                "save_config": "Save Configuration",
-                "reload_config": "Reload",
-                "reset_default": "Reset Default",
-                "clear_logs": "Clear Logs",
-                # 设备选项
-                "device_options": ["0: Default Device", "1: System Default", "2: Primary Microphone"],
-                # 日志消息
-                "interface_started": "Configuration interface started",
-                "config_loaded": "Configuration loaded to interface",
-                "config_saved": "Configuration saved to .env file.Please completely exit the program and reload it.",
-                "config_save_failed": "Failed to save configuration",
-                "default_reset": "Default configuration reset",
-                # 消息框
-                "success": "Success",
-                "error": "Error",
-                "confirm": "Confirm",
-                "reset_confirm": "Are you sure you want to reset to default configuration?"
-            }
-        }
     
     def get(self, key):
         """获取当前语言的文本"""
-        return self.texts[self.current_language].get(key, key)
+        return self._TEXTS[self.current_language].get(key, key)
     
     def set_language(self, language):
         """设置语言"""
-        if language in self.texts:
+        if language in self._TEXTS:
             self.current_language = language
     
     def get_all_texts(self):
         """获取当前语言的所有文本"""
-        return self.texts[self.current_language]
+        return self._TEXTS[self.current_language]
 
 class ConfigManager:
     """配置管理器 - 专门处理.env文件读写"""
@@ -136,12 +158,13 @@ class ConfigManager:
         """从.env文件加载配置"""
         try:
             if os.path.exists(self.env_file):
-                with open(self.env_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            self.config[key.strip()] = value.strip()
+                with open(self.env_file, 'rb') as f:
+                    data = f.read().decode('utf-8')
+                pairs = ENV_LINE_RE.findall(data)
+                self.config.update(pairs)
+                # 与load_dotenv行为一致：不覆盖已存在的环境变量
+                for key, value in pairs:
+                    os.environ.setdefault(key, value)
             else:
                 # 如果.env文件不存在，创建默认配置
                 self.create_default_config()
@@ -162,7 +185,7 @@ class ConfigManager:
             "DEEPSEEK_BASE_URL": "https://api.deepseek.com",
             "DEEPSEEK_API_KEY": "",
             "DEEPSEEK_MODEL": "deepseek-chat",
-            "AUDIO_CHUNK": "1024",
+            "AUDIO_CHUNK": "256",
             "AUDIO_RATE": "16000",
             "AUDIO_CHANNELS": "1",
             "LOG_LEVEL": "INFO"
@@ -172,9 +195,12 @@ class ConfigManager:
     def save_config(self):
         """保存配置到.env文件"""
         try:
-            with open(self.env_file, 'w', encoding='utf-8') as f:
-                for key, value in self.config.items():
-                    f.write(f"{key}={value}\n")
+            payload = ("\n".join(f"{key}={value}" for key, value in self.config.items()) + "\n").encode('utf-8')
+            # 先写临时文件再替换，避免写入中途失败留下不完整的.env
+            tmp_file = self.env_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.env_file)
             return True
         except Exception as e:
             print(f"保存配置文件失败: {e}")
@@ -189,7 +215,20 @@ class ConfigManager:
         self.config[key] = value
 
 class ConfigGUI:
+    # log_message的时间戳缓存
+    _last_ts_sec = 0
+    _last_ts_str = ''
+    
+    # 消息框类型 -> tkinter.messagebox函数名
+    _MB_FUNCS = {"error": "showerror", "info": "showinfo", "yesno": "askyesno"}
+    _messagebox = None
+    
     def __init__(self):
+        import_gui_modules()
+        
+        # 等待写入日志文本框的消息
+        self._pending_logs = []
+        
         # 双语文本管理器
         self.text_manager = BilingualText()
         
@@ -240,36 +279,14 @@ class ConfigGUI:
     
     def update_ui_texts(self):
         """更新界面文本"""
-        # 更新配置框架标题
-        self.config_frame.configure(text=self.text_manager.get("config_frame"))
-        
-        # 更新日志框架标题
-        self.log_frame.configure(text=self.text_manager.get("log_frame"))
-        
-        # 更新按钮文本
-        self.save_button.configure(text=self.text_manager.get("save_config"))
-        self.reload_button.configure(text=self.text_manager.get("reload_config"))
-        self.reset_button.configure(text=self.text_manager.get("reset_default"))
-        self.clear_logs_button.configure(text=self.text_manager.get("clear_logs"))
-        
-        # 更新标签文本
-        self.source_lang_label.configure(text=self.text_manager.get("source_language"))
-        self.target_lang_label.configure(text=self.text_manager.get("target_languages"))
-        self.microphone_label.configure(text=self.text_manager.get("microphone_device"))
-        self.whisper_label.configure(text=self.text_manager.get("whisper_model"))
-        self.api_url_label.configure(text=self.text_manager.get("api_url"))
-        self.api_key_label.configure(text=self.text_manager.get("api_key"))
-        self.api_model_label.configure(text=self.text_manager.get("api_model"))
-        self.osc_address_label.configure(text=self.text_manager.get("osc_address"))
-        self.osc_port_label.configure(text=self.text_manager.get("osc_port"))
-        self.hotkey_label.configure(text=self.text_manager.get("hotkey"))
-        self.audio_chunk_label.configure(text=self.text_manager.get("audio_chunk"))
-        self.audio_rate_label.configure(text=self.text_manager.get("audio_rate"))
-        self.audio_channels_label.configure(text=self.text_manager.get("audio_channels"))
-        self.log_level_label.configure(text=self.text_manager.get("log_level"))
+        tm_get = self.text_manager.get
+        
+        # 按(控件, 文本键)表批量更新框架、按钮和标签文本
+        for widget, key in self._labelled:
+            widget.configure(text=tm_get(key))
         
         # 更新设备选项
-        device_options = self.text_manager.get("device_options")
+        device_options = tm_get("device_options")
         self.audio_device_combo.configure(values=device_options)
         
     def setup_config_section(self, parent):
@@ -280,7 +297,7 @@ class ConfigGUI:
         # 源语言
         self.source_lang_label = ttk.Label(self.config_frame, text=self.text_manager.get("source_language"))
         self.source_lang_label.grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.source_lang_combo = ttk.Combobox(self.config_frame, values=["zh", "en", "ja", "ko", "fr", "de", "es", "ru"], width=10)
+        self.source_lang_combo = ttk.Combobox(self.config_frame, values=SOURCE_LANGUAGES, width=10)
         self.source_lang_combo.grid(row=0, column=1, sticky="w")
         
         # 目标语言
@@ -288,7 +305,7 @@ class ConfigGUI:
         self.target_lang_label.grid(row=1, column=0, sticky="w", padx=(0, 5))
         self.target_lang_vars = {}
         
-        for i, lang in enumerate(["en", "ja", "ko", "fr", "de", "es", "ru"]):
+        for i, lang in enumerate(TARGET_LANGUAGES):
             var = tk.BooleanVar()
             self.target_lang_vars[lang] = var
             cb = ttk.Checkbutton(self.config_frame, text=lang, variable=var)
@@ -303,7 +320,7 @@ class ConfigGUI:
         # 语音识别模型大小
         self.whisper_label = ttk.Label(self.config_frame, text=self.text_manager.get("whisper_model"))
         self.whisper_label.grid(row=4, column=0, sticky="w", padx=(0, 5))
-        self.whisper_model_combo = ttk.Combobox(self.config_frame, values=["tiny", "base", "small", "medium", "large-v3", "large-v3-turbo"], width=15)
+        self.whisper_model_combo = ttk.Combobox(self.config_frame, values=WHISPER_MODELS, width=15)
         self.whisper_model_combo.grid(row=4, column=1, sticky="w")
         
         # API配置
@@ -357,7 +374,7 @@ class ConfigGUI:
         # 日志级别
         self.log_level_label = ttk.Label(self.config_frame, text=self.text_manager.get("log_level"))
         self.log_level_label.grid(row=11, column=2, sticky="w", padx=(10, 5))
-        self.log_level_combo = ttk.Combobox(self.config_frame, values=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], width=10)
+        self.log_level_combo = ttk.Combobox(self.config_frame, values=LOG_LEVELS, width=10)
         self.log_level_combo.grid(row=11, column=3, sticky="w")
         
         # 按钮区域
@@ -367,12 +384,34 @@ class ConfigGUI:
         self.save_button = ttk.Button(button_frame, text=self.text_manager.get("save_config"), command=self.save_config)
         self.save_button.pack(side="left", padx=(0, 10))
         
-        self.reload_button = ttk.Button(button_frame, text=self.text_manager.get("reload_config"), command=self.load_current_config)
+        self.reload_button = ttk.Button(button_frame, text=self.text_manager.get("reload_config"), command=lambda: self.load_current_config(force_reload=True))
         self.reload_button.pack(side="left", padx=(0, 10))
         
         self.reset_button = ttk.Button(button_frame, text=self.text_manager.get("reset_default"), command=self.reset_default)
         self.reset_button.pack(side="left")
         
+        # 需要随语言切换更新文本的控件
+        self._labelled = [
+            (self.config_frame, "config_frame"),
+            (self.save_button, "save_config"),
+            (self.reload_button, "reload_config"),
+            (self.reset_button, "reset_default"),
+            (self.source_lang_label, "source_language"),
+            (self.target_lang_label, "target_languages"),
+            (self.microphone_label, "microphone_device"),
+            (self.whisper_label, "whisper_model"),
+            (self.api_url_label, "api_url"),
+            (self.api_key_label, "api_key"),
+            (self.api_model_label, "api_model"),
+            (self.osc_address_label, "osc_address"),
+            (self.osc_port_label, "osc_port"),
+            (self.hotkey_label, "hotkey"),
+            (self.audio_chunk_label, "audio_chunk"),
+            (self.audio_rate_label, "audio_rate"),
+            (self.audio_channels_label, "audio_channels"),
+            (self.log_level_label, "log_level"),
+        ]
+        
     def setup_log_section(self, parent):
         """设置日志显示区域"""
         self.log_frame = ttk.LabelFrame(parent, text=self.text_manager.get("log_frame"), padding="10")
@@ -386,77 +425,85 @@ class ConfigGUI:
         self.clear_logs_button = ttk.Button(self.log_frame, text=self.text_manager.get("clear_logs"), command=self.clear_logs)
         self.clear_logs_button.pack(pady=(5, 0))
         
-    def load_current_config(self):
+        self._labelled.append((self.log_frame, "log_frame"))
+        self._labelled.append((self.clear_logs_button, "clear_logs"))
+        
+    def load_current_config(self, force_reload=False):
         """加载当前配置到界面"""
+        tm_get = self.text_manager.get
+        cm_get = self.config_manager.get
         try:
-            # 重新加载配置
-            self.config_manager.load_config()
+            # 仅在点击"重新加载"时重新读取.env，启动时ConfigManager已加载过
+            if force_reload:
+                self.config_manager.load_config()
             
             # 源语言
-            self.source_lang_combo.set(self.config_manager.get("SOURCE_LANGUAGE", "zh"))
+            self.source_lang_combo.set(cm_get("SOURCE_LANGUAGE", "zh"))
             
             # 目标语言
-            target_langs = self.config_manager.get("TARGET_LANGUAGES", "en,ja,ko").split(",")
+            target_langs = set(cm_get("TARGET_LANGUAGES", "en,ja,ko").split(","))
             for lang, var in self.target_lang_vars.items():
                 var.set(lang in target_langs)
             
             # 音频设备
-            default_device_index = self.config_manager.get("AUDIO_DEVICE_INDEX", "0")
-            device_options = self.text_manager.get("device_options")
-            if default_device_index and default_device_index.isdigit():
-                device_index = int(default_device_index)
-                if device_index < len(device_options):
-                    self.audio_device_combo.set(device_options[device_index])
-                else:
-                    self.audio_device_combo.set(f"{default_device_index}: Device {default_device_index}")
+            default_device_index = cm_get("AUDIO_DEVICE_INDEX", "0")
+            device_options = tm_get("device_options")
+            try:
+                device_index = max(int(default_device_index), 0)
+            except (TypeError, ValueError):
+                device_index = 0
+            if device_index < len(device_options):
+                self.audio_device_combo.set(device_options[device_index])
             else:
-                self.audio_device_combo.set(device_options[0])
+                self.audio_device_combo.set(f"{device_index}: Device {device_index}")
             
             # Whisper模型
-            self.whisper_model_combo.set(self.config_manager.get("WHISPER_MODEL", "large-v3-turbo"))
+            self.whisper_model_combo.set(cm_get("WHISPER_MODEL", "large-v3-turbo"))
             
             # API配置
-            self.api_base_url_entry.delete(0, "end")
-            self.api_base_url_entry.insert(0, self.config_manager.get("DEEPSEEK_BASE_URL", "https://api.deepseek.com"))
-            
-            self.api_key_entry.delete(0, "end")
-            self.api_key_entry.insert(0, self.config_manager.get("DEEPSEEK_API_KEY", ""))
-            
-            self.api_model_entry.delete(0, "end")
-            self.api_model_entry.insert(0, self.config_manager.get("DEEPSEEK_MODEL", "deepseek-chat"))
+            self._set_entry(self.api_base_url_entry, cm_get("DEEPSEEK_BASE_URL", "https://api.deepseek.com"))
+            self._set_entry(self.api_key_entry, cm_get("DEEPSEEK_API_KEY", ""))
+            self._set_entry(self.api_model_entry, cm_get("DEEPSEEK_MODEL", "deepseek-chat"))
             
             # OSC配置
-            self.osc_ip_entry.delete(0, "end")
-            self.osc_ip_entry.insert(0, self.config_manager.get("OSC_IP", "127.0.0.1"))
-            
-            self.osc_port_entry.delete(0, "end")
-            self.osc_port_entry.insert(0, self.config_manager.get("OSC_PORT", "9000"))
+            self._set_entry(self.osc_ip_entry, cm_get("OSC_IP", "127.0.0.1"))
+            self._set_entry(self.osc_port_entry, cm_get("OSC_PORT", "9000"))
             
             # 快捷键
-            self.hotkey_entry.delete(0, "end")
-            self.hotkey_entry.insert(0, self.config_manager.get("HOTKEY", "k"))
+            self._set_entry(self.hotkey_entry, cm_get("HOTKEY", "k"))
             
             # 音频参数
-            self.audio_chunk_entry.delete(0, "end")
-            self.audio_chunk_entry.insert(0, self.config_manager.get("AUDIO_CHUNK", "1024"))
-            
-            self.audio_rate_entry.delete(0, "end")
-            self.audio_rate_entry.insert(0, self.config_manager.get("AUDIO_RATE", "16000"))
-            
-            self.audio_channels_entry.delete(0, "end")
-            self.audio_channels_entry.insert(0, self.config_manager.get("AUDIO_CHANNELS", "1"))
+            self._set_entry(self.audio_chunk_entry, cm_get("AUDIO_CHUNK", "256"))
+            self._set_entry(self.audio_rate_entry, cm_get("AUDIO_RATE", "16000"))
+            self._set_entry(self.audio_channels_entry, cm_get("AUDIO_CHANNELS", "1"))
             
             # 日志级别
-            self.log_level_combo.set(self.config_manager.get("LOG_LEVEL", "INFO"))
+            self.log_level_combo.set(cm_get("LOG_LEVEL", "INFO"))
             
-            self.log_message(self.text_manager.get("config_loaded"))
+            self.log_message(tm_get("config_loaded"))
             
         except Exception as e:
             self.log_message(f"加载配置失败: {e}")
-            messagebox.showerror(self.text_manager.get("error"), f"加载配置失败: {e}")
+            self._mb("error", tm_get("error"), f"加载配置失败: {e}")
+    
+    def _mb(self, kind, title, message):
+        """显示消息框，首次使用时才导入tkinter.messagebox"""
+        if self._messagebox is None:
+            from tkinter import messagebox
+            self._messagebox = messagebox
+        return getattr(self._messagebox, self._MB_FUNCS[kind])(title, message)
+    
+    @staticmethod
+    def _set_entry(entry, value):
+        """设置输入框内容，值未变化时跳过"""
+        if entry.get() != value:
+            entry.delete(0, "end")
+            entry.insert(0, value)
     
     def save_config(self):
         """保存配置到.env文件"""
+        tm_get = self.text_manager.get
+        cm_set = self.config_manager.set
         try:
             # 提取音频设备索引
             audio_device_index = None
@@ -465,55 +512,72 @@ class ConfigGUI:
                 audio_device_index = device_str.split(':')[0].strip()
             
             # 更新配置管理器
-            self.config_manager.set("SOURCE_LANGUAGE", self.source_lang_combo.get())
-            self.config_manager.set("TARGET_LANGUAGES", ",".join([lang for lang, var in self.target_lang_vars.items() if var.get()]))
-            self.config_manager.set("WHISPER_MODEL", self.whisper_model_combo.get())
-            self.config_manager.set("DEEPSEEK_BASE_URL", self.api_base_url_entry.get())
-            self.config_manager.set("DEEPSEEK_API_KEY", self.api_key_entry.get())
-            self.config_manager.set("DEEPSEEK_MODEL", self.api_model_entry.get())
-            self.config_manager.set("OSC_IP", self.osc_ip_entry.get())
-            self.config_manager.set("OSC_PORT", self.osc_port_entry.get())
-            self.config_manager.set("HOTKEY", self.hotkey_entry.get())
-            self.config_manager.set("AUDIO_CHUNK", self.audio_chunk_entry.get())
-            self.config_manager.set("AUDIO_RATE", self.audio_rate_entry.get())
-            self.config_manager.set("AUDIO_CHANNELS", self.audio_channels_entry.get())
-            self.config_manager.set("LOG_LEVEL", self.log_level_combo.get())
+            cm_set("SOURCE_LANGUAGE", self.source_lang_combo.get())
+            cm_set("TARGET_LANGUAGES", ",".join(lang for lang, var in self.target_lang_vars.items() if var.get()))
+            cm_set("WHISPER_MODEL", self.whisper_model_combo.get())
+            cm_set("DEEPSEEK_BASE_URL", self.api_base_url_entry.get())
+            cm_set("DEEPSEEK_API_KEY", self.api_key_entry.get())
+            cm_set("DEEPSEEK_MODEL", self.api_model_entry.get())
+            cm_set("OSC_IP", self.osc_ip_entry.get())
+            cm_set("OSC_PORT", self.osc_port_entry.get())
+            cm_set("HOTKEY", self.hotkey_entry.get())
+            cm_set("AUDIO_CHUNK", self.audio_chunk_entry.get())
+            cm_set("AUDIO_RATE", self.audio_rate_entry.get())
+            cm_set("AUDIO_CHANNELS", self.audio_channels_entry.get())
+            cm_set("LOG_LEVEL", self.log_level_combo.get())
             
             # 添加音频设备配置
             if audio_device_index:
-                self.config_manager.set("AUDIO_DEVICE_INDEX", audio_device_index)
+                cm_set("AUDIO_DEVICE_INDEX", audio_device_index)
             
             # 保存配置
             if self.config_manager.save_config():
-                self.log_message(self.text_manager.get("config_saved"))
-                messagebox.showinfo(self.text_manager.get("success"), self.text_manager.get("config_saved"))
+                self.log_message(tm_get("config_saved"))
+                self._mb("info", tm_get("success"), tm_get("config_saved"))
             else:
-                self.log_message(self.text_manager.get("config_save_failed"))
-                messagebox.showerror(self.text_manager.get("error"), self.text_manager.get("config_save_failed"))
+                self.log_message(tm_get("config_save_failed"))
+                self._mb("error", tm_get("error"), tm_get("config_save_failed"))
                 
         except Exception as e:
             self.log_message(f"保存配置失败: {e}")
-            messagebox.showerror(self.text_manager.get("error"), f"保存配置失败: {e}")
+            self._mb("error", tm_get("error"), f"保存配置失败: {e}")
     
     def reset_default(self):
         """重置为默认配置"""
         try:
-            result = messagebox.askyesno(self.text_manager.get("confirm"), self.text_manager.get("reset_confirm"))
+            result = self._mb("yesno", self.text_manager.get("confirm"), self.text_manager.get("reset_confirm"))
             if result:
                 self.config_manager.create_default_config()
                 self.load_current_config()
                 self.log_message(self.text_manager.get("default_reset"))
         except Exception as e:
             self.log_message(f"重置配置失败: {e}")
-            messagebox.showerror(self.text_manager.get("error"), f"重置配置失败: {e}")
+            self._mb("error", self.text_manager.get("error"), f"重置配置失败: {e}")
     
     def clear_logs(self):
         """清空日志"""
+        self._pending_logs.clear()
         self.log_text.delete(1.0, "end")
     
     def log_message(self, message):
         """添加日志消息"""
-        self.log_text.insert("end", f"{time.strftime('%H:%M:%S')} - {message}\n")
+        # 同一秒内复用已格式化的时间戳
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime('%H:%M:%S', time.localtime(now))
+        
+        # 连续的日志合并到一次空闲回调中写入文本框
+        self._pending_logs.append(f"{self._last_ts_str} - {message}\n")
+        if len(self._pending_logs) == 1:
+            self.root.after_idle(self.flush_logs)
+    
+    def flush_logs(self):
+        """将待写入的日志一次性写入文本框"""
+        if not self._pending_logs:
+            return
+        self.log_text.insert("end", "".join(self._pending_logs))
+        self._pending_logs.clear()
         self.log_text.see("end")
     
     def run(self):
@@ -522,11 +586,14 @@ class ConfigGUI:
 
 def main():
     """主函数"""
+    import_gui_modules()
+    
     try:
         app = ConfigGUI()
         app.run()
         
     except Exception as e:
+        from tkinter import messagebox
         messagebox.showerror("错误", f"启动配置界面失败: {e}")
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ Real-time voice recording, translation through DeepSeek to multiple languages, s
 import pyaudio
 import threading
 import time
+import hashlib
+import itertools
 import os
 import sys
 import io
@@ -17,14 +19,17 @@ import numpy as np
 import json
 import asyncio
 from pynput import keyboard
-from pynput.keyboard import Key, Listener
+from pynput.keyboard import Key, KeyCode, Listener
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 from dotenv import load_dotenv
-import whisper
 import torch
 from pythonosc import udp_client
-from openai import OpenAI
-import queue
+from openai import AsyncOpenAI
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import re
 
 # 设置系统编码为UTF-8
@@ -34,30 +39,71 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 # 加载环境变量
 load_dotenv()
 
+# int16 PCM转换为float32时的缩放系数
+PCM_SCALE = np.float32(1.0 / 32768.0)
+
+class PartialTranscript:
+    """一次录音的增量转录状态"""
+    def __init__(self):
+        self.active = True
+        self.committed = 0  # 已转录的样本数
+        self.texts = []
+        self.thread = None
+        self.audio_buffer = None  # 窗口转换用的float32缓冲区
+
 class VRChatTranslator:
     def __init__(self):
         # 音频参数
-        self.CHUNK = int(os.getenv("AUDIO_CHUNK", "1024"))
+        # 每次回调的帧数：256帧@16kHz约16ms，延迟更低但回调更频繁；回调模式下开销很小
+        self.CHUNK = int(os.getenv("AUDIO_CHUNK", "256"))
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = int(os.getenv("AUDIO_CHANNELS", "1"))
         self.RATE = int(os.getenv("AUDIO_RATE", "16000"))
         
         # 录音状态
         self.is_recording = False
-        self.audio_data = None
+        self.pcm_buffer = None  # 预分配的int16录音缓冲区
+        self.pcm_length = 0     # 已写入的样本数
+        self.max_record_seconds = 60
+        # 转录时int16→float32转换用的缓冲区，仅在转录线程中使用
+        self.audio_buffer = np.empty(self.RATE * self.CHANNELS * self.max_record_seconds, dtype=np.float32)
+        
+        # 松开快捷键的防抖与重复录音检测
+        self.recording_lock = threading.Lock()
+        self.release_timer = None
+        self.release_debounce = 0.25  # 秒
+        self.last_audio_hash = None
+        self.last_audio_time = 0.0
+        self.duplicate_window = 2.0  # 秒
+        
+        # 录音期间的增量转录，每积累该秒数的音频转录一次，0表示关闭
+        self.stream_window = int(float(os.getenv("STREAM_WINDOW_SECONDS", "0")) * self.RATE * self.CHANNELS)
+        self.partial_transcript = None
         self.audio = None
         self.stream = None
         
         # Whisper模型
         self.model = None
         self.model_size = os.getenv("WHISPER_MODEL", "large-v3-turbo")
+        # 转录后端: faster-whisper (默认，未安装时回退) 或 whisper
+        self.whisper_backend = os.getenv("WHISPER_BACKEND", "faster-whisper").lower()
+        # CPU推理时的量化方式: int8 (默认) 或 none
+        self.whisper_quantize = os.getenv("WHISPER_QUANTIZE", "int8").lower()
+        self.device = "cpu"
+        self.use_fp16 = False
+        # 低于该RMS音量的录音视为静音，不进行转录
+        self.silence_threshold = float(os.getenv("VAD_RMS_THRESHOLD", "0.005"))
+        self.model_lock = threading.Lock()
         
         # 翻译设置
         self.source_language = os.getenv("SOURCE_LANGUAGE", "zh")
         self.target_languages = os.getenv("TARGET_LANGUAGES", "en,ja,ko").split(",")
+        # 拼接多段转录文本时使用的分隔符
+        self.text_separator = "" if self.source_language in ("zh", "ja") else " "
         
         # OpenAI客户端 (用于DeepSeek)
-        self.openai_client = None
+        self.http_client = None
+        self.async_openai_client = None
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
         self.model_name = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
         self.base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
@@ -70,34 +116,56 @@ class VRChatTranslator:
         # 快捷键状态
         self.hotkey_pressed = False
         self.hotkey_char = os.getenv("HOTKEY", "k").lower()
+        # 预先构造快捷键的KeyCode (含大写)，按键事件中直接比较
+        self.hotkey_keys = (KeyCode.from_char(self.hotkey_char), KeyCode.from_char(self.hotkey_char.upper()))
+        
+        # 翻译事件循环
+        self.loop = None
+        self.transcribe_executor = None
+        # 录音序号，保证对话框不会被较早录音的结果覆盖
+        self.utterance_counter = itertools.count()
+        self.last_sent_sequence = -1
         
-        # 翻译队列
-        self.translation_queue = queue.Queue()
-        self.is_translating = False
+        # 翻译结果缓存 (LRU) 与正在进行的翻译请求，均只在事件循环线程中访问
+        self.translation_cache = OrderedDict()
+        self.translation_cache_size = 1024
+        self.pending_translations = {}
         
         # 初始化日志
+        self.log_listener = None
         self.setup_logging()
         
-        # 初始化各个模块
-        self.setup_audio()
-        self.load_model()
-        self.setup_openai_client()
-        self.setup_osc_client()
-        
-        # 启动翻译队列处理线程
-        self.start_translation_worker()
+        try:
+            # 初始化各个模块
+            self.setup_audio()
+            self.load_model()
+            self.setup_openai_client()
+            self.setup_osc_client()
+            
+            # 启动翻译队列处理线程
+            self.start_translation_worker()
+        except BaseException:
+            # 初始化失败时调用方拿不到实例，在这里释放日志监听线程等已创建的资源
+            self.cleanup()
+            raise
         
     def setup_logging(self):
         """设置日志"""
         log_level = os.getenv("LOG_LEVEL", "INFO")
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('vrchat_translator.log', encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('vrchat_translator.log', encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        
+        # 录音回调和转录线程只把日志放入队列，由监听线程写入文件和控制台
+        log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        self.log_listener.start()
+        
+        root_logger = logging.getLogger()
+        root_logger.handlers = [QueueHandler(log_queue)]
+        root_logger.setLevel(getattr(logging, log_level))
         self.logger = logging.getLogger(__name__)
         
     def setup_audio(self):
@@ -166,24 +234,91 @@ class VRChatTranslator:
     def load_model(self):
         """加载Whisper模型"""
         try:
-            self.logger.info(f"正在加载Whisper模型: {self.model_size}")
+            self.logger.info(f"正在加载Whisper模型: {self.model_size} (后端: {self.whisper_backend})")
             
             # 尝试检测CUDA可用性，如果失败则回退到CPU
             device = self.detect_device()
             self.logger.info(f"使用设备: {device}")
             
-            self.model = whisper.load_model(self.model_size, device=device)
+            self.create_model(device)
             self.logger.info("Whisper模型加载成功")
         except Exception as e:
             self.logger.error(f"模型加载失败: {e}")
             # 如果CUDA加载失败，尝试使用CPU
             try:
                 self.logger.info("尝试使用CPU加载模型...")
-                self.model = whisper.load_model(self.model_size, device="cpu")
+                self.create_model("cpu")
                 self.logger.info("Whisper模型在CPU上加载成功")
             except Exception as cpu_error:
                 self.logger.error(f"CPU模型加载也失败: {cpu_error}")
                 raise
+        
+        self.warm_up_model()
+    
+    def warm_up_model(self):
+        """用1秒静音预热模型，避免第一次录音时的冷启动延迟"""
+        try:
+            self.logger.info("正在预热Whisper模型...")
+            self.run_whisper(np.zeros(self.RATE, dtype=np.float32))
+            # 只有openai-whisper使用torch的CUDA流；faster-whisper下调用会额外创建torch CUDA上下文占用显存
+            if self.device == "cuda" and self.whisper_backend == "whisper":
+                torch.cuda.synchronize()
+            self.logger.info("Whisper模型预热完成")
+        except Exception as e:
+            self.logger.warning(f"模型预热失败: {e}")
+    
+    def create_model(self, device):
+        """在指定设备上创建Whisper模型"""
+        if self.whisper_backend == "faster-whisper":
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                self.logger.warning("未安装faster-whisper，改用openai-whisper")
+                self.whisper_backend = "whisper"
+        
+        if self.whisper_backend == "faster-whisper":
+            # CTranslate2后端：CPU上使用int8，CUDA上优先float16
+            # Volta之前的GPU不支持float16，依次尝试int8和float32，避免直接回退到CPU
+            if device == "cuda":
+                compute_types = ("float16", "int8", "float32")
+            else:
+                compute_types = ("int8" if self.whisper_quantize == "int8" else "float32",)
+            
+            for compute_type in compute_types:
+                try:
+                    self.model = WhisperModel(self.model_size, device=device, compute_type=compute_type)
+                    break
+                except ValueError as e:
+                    if compute_type == compute_types[-1]:
+                        raise
+                    self.logger.warning(f"不支持计算类型 {compute_type}: {e}，尝试下一种")
+            self.logger.info(f"faster-whisper计算类型: {compute_type}")
+        else:
+            import whisper
+            self.model = whisper.load_model(self.model_size, device=device)
+            if device == "cpu":
+                self.quantize_model()
+        
+        self.device = device
+        self.use_fp16 = (device == "cuda")
+    
+    def quantize_model(self):
+        """对CPU上的Whisper模型做int8动态量化，失败时保留原模型"""
+        if self.whisper_quantize != "int8":
+            return
+        
+        try:
+            # whisper自定义的Linear是nn.Linear的子类，quantize_dynamic只按精确类型匹配；
+            # 在CPU(fp32)上两者的前向计算相同，先还原为nn.Linear再量化
+            for module in self.model.modules():
+                if isinstance(module, torch.nn.Linear):
+                    module.__class__ = torch.nn.Linear
+            
+            # 原地量化，避免复制整个fp32模型导致内存峰值翻倍
+            self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+            self.logger.info("Whisper模型已进行int8动态量化")
+        except Exception as e:
+            self.logger.warning(f"模型量化失败: {e}，使用未量化模型")
     
     def detect_device(self):
         """检测可用的设备，优先使用CUDA，如果失败则回退到CPU"""
@@ -227,9 +362,20 @@ class VRChatTranslator:
             if not self.api_key:
                 raise ValueError("未设置DEEPSEEK_API_KEY环境变量")
             
-            self.openai_client = OpenAI(
+            # 保持长连接并启用HTTP/2，并发请求复用同一个TLS连接
+            client_options = dict(
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+            try:
+                self.http_client = httpx.AsyncClient(http2=True, **client_options)
+            except ImportError:
+                self.logger.warning("未安装h2，使用HTTP/1.1连接")
+                self.http_client = httpx.AsyncClient(http2=False, **client_options)
+            self.async_openai_client = AsyncOpenAI(
                 api_key=self.api_key,
-                base_url=self.base_url
+                base_url=self.base_url,
+                http_client=self.http_client
             )
             self.logger.info("OpenAI客户端初始化成功")
         except Exception as e:
@@ -247,153 +393,252 @@ class VRChatTranslator:
     
     def start_recording(self):
         """开始录音"""
-        if self.is_recording:
-            return
-            
-        try:
-            self.is_recording = True
-            self.audio_data = []
-            
-            # 打开音频流，使用选择的设备索引
-            self.stream = self.audio.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.RATE,
-                input=True,
-                input_device_index=self.input_device_index,
-                frames_per_buffer=self.CHUNK
-            )
-            
-            device_info = self.audio.get_device_info_by_index(self.input_device_index)
-            self.logger.info(f"开始录音... 使用设备: {device_info.get('name')}")
-            
-            # 在单独的线程中录音
-            self.recording_thread = threading.Thread(target=self.record_audio)
-            self.recording_thread.daemon = True
-            self.recording_thread.start()
-            
-        except Exception as e:
-            self.logger.error(f"开始录音失败: {e}")
-            self.is_recording = False
+        # 与finish_recording互斥，避免停止过程中替换录音状态
+        with self.recording_lock:
+            if self.is_recording:
+                return
+                
+            try:
+                self.is_recording = True
+                self.pcm_buffer = np.empty(self.RATE * self.CHANNELS * self.max_record_seconds, dtype=np.int16)
+                self.pcm_length = 0
+                
+                # 打开音频流，使用选择的设备索引
+                self.stream = self.audio.open(
+                    format=self.FORMAT,
+                    channels=self.CHANNELS,
+                    rate=self.RATE,
+                    input=True,
+                    input_device_index=self.input_device_index,
+                    frames_per_buffer=self.CHUNK,
+                    stream_callback=self.audio_callback  # 由PortAudio线程直接回调写入缓冲区
+                )
+                
+                device_info = self.audio.get_device_info_by_index(self.input_device_index)
+                self.logger.info(f"开始录音... 使用设备: {device_info.get('name')}")
+                
+                if self.stream_window > 0:
+                    self.start_partial_transcription()
+                
+            except Exception as e:
+                self.logger.error(f"开始录音失败: {e}")
+                self.is_recording = False
     
-    def record_audio(self):
-        """录音线程"""
+    def audio_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio录音回调"""
         try:
-            while self.is_recording:
-                data = self.stream.read(self.CHUNK, exception_on_overflow=False)
-                self.audio_data.append(data)
+            self.append_pcm(in_data)
         except Exception as e:
             self.logger.error(f"录音过程中出错: {e}")
+            return (None, pyaudio.paAbort)
+        return (None, pyaudio.paContinue)
+    
+    def append_pcm(self, data):
+        """将一块PCM数据写入录音缓冲区，空间不足时扩容"""
+        samples = np.frombuffer(data, dtype=np.int16)
+        start = self.pcm_length
+        end = start + samples.size
+        if end > self.pcm_buffer.size:
+            grown = np.empty(max(end, self.pcm_buffer.size * 2), dtype=np.int16)
+            grown[:start] = self.pcm_buffer[:start]
+            self.pcm_buffer = grown
+        self.pcm_buffer[start:end] = samples
+        self.pcm_length = end
     
     def stop_recording(self):
-        """停止录音并开始处理"""
+        """松开快捷键后延迟停止录音，防抖时间内再次按下则继续录音"""
         if not self.is_recording:
             return
+        
+        with self.recording_lock:
+            if self.release_timer:
+                self.release_timer.cancel()
+            self.release_timer = threading.Timer(self.release_debounce, self.finish_recording)
+            self.release_timer.daemon = True
+            self.release_timer.start()
+    
+    def resume_recording(self):
+        """取消尚未执行的停止录音，返回是否取消成功"""
+        with self.recording_lock:
+            timer = self.release_timer
+            self.release_timer = None
+        if timer:
+            timer.cancel()
+            return True
+        return False
+    
+    def finish_recording(self):
+        """停止录音并开始处理"""
+        # 在锁内取出本次录音的状态，再次按键开始的新录音不会被影响
+        with self.recording_lock:
+            # 定时器已被再次按键取消或替换
+            if threading.current_thread() is not self.release_timer:
+                return
+            self.release_timer = None
+            self.is_recording = False
             
-        self.is_recording = False
+            # 停止增量转录，正在转录的窗口会在翻译线程中等待完成
+            partial = self.partial_transcript
+            self.partial_transcript = None
+            if partial:
+                partial.active = False
+            
+            stream = self.stream
+            self.stream = None
+            try:
+                # 停止音频流，之后不会再有回调写入缓冲区
+                if stream:
+                    stream.stop_stream()
+                    stream.close()
+            except Exception as e:
+                self.logger.error(f"停止录音过程中出错: {e}")
+            
+            pcm_buffer = self.pcm_buffer
+            pcm_length = self.pcm_length
+            self.pcm_length = 0
         
         try:
-            # 停止音频流
-            if self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-            
             self.logger.info("录音停止，开始处理...")
             
             # 直接使用内存中的音频数据进行转录
-            if self.audio_data:
-                # 将音频数据加入翻译队列
-                self.translation_queue.put(self.audio_data.copy())
-                self.audio_data.clear()
+            if pcm_length:
+                # 直接交出已写入部分的视图，下次录音会重新分配缓冲区，无需复制
+                pcm = pcm_buffer[:pcm_length]
+                
+                # 短时间内重复的录音数据不再重复处理
+                audio_hash = hashlib.blake2b(pcm, digest_size=16).hexdigest()
+                now = time.monotonic()
+                if audio_hash == self.last_audio_hash and now - self.last_audio_time < self.duplicate_window:
+                    self.logger.info("录音数据与上一次相同，跳过处理")
+                    return
+                self.last_audio_hash = audio_hash
+                self.last_audio_time = now
+                
+                # 提交到翻译事件循环，上一段录音仍在处理时可以并行
+                self.submit_utterance(pcm, partial)
             else:
                 self.logger.error("没有录音数据")
                 
         except Exception as e:
             self.logger.error(f"停止录音过程中出错: {e}")
     
-    def transcribe_audio(self, audio_data):
-        """转录音频数据并进行语义修正"""
+    def start_partial_transcription(self):
+        """录音期间按窗口增量转录，松开快捷键时只剩最后一段需要转录"""
+        self.partial_transcript = PartialTranscript()
+        self.partial_transcript.audio_buffer = np.empty(self.stream_window, dtype=np.float32)
+        self.partial_transcript.thread = threading.Thread(
+            target=self.partial_transcription_worker, args=(self.partial_transcript,)
+        )
+        self.partial_transcript.thread.daemon = True
+        self.partial_transcript.thread.start()
+    
+    def partial_transcription_worker(self, partial):
+        """增量转录线程"""
+        while True:
+            # 在锁内读取录音状态，录音结束后不会读到下一次录音的缓冲区
+            # 录音回调写入时不持锁：先读长度再读缓冲区，append_pcm先换缓冲区后更新长度，
+            # 这样读到的缓冲区一定包含前pcm_length个采样(扩容时已复制)
+            with self.recording_lock:
+                if not partial.active:
+                    break
+                pcm_length = self.pcm_length
+                pcm_buffer = self.pcm_buffer
+            
+            start = partial.committed
+            end = start + self.stream_window
+            if pcm_length < end or end > pcm_buffer.size:
+                time.sleep(0.05)
+                continue
+            
+            try:
+                audio_np = self.pcm_to_float32(pcm_buffer[start:end], partial.audio_buffer)
+                if self.is_silent(audio_np):
+                    self.logger.debug("增量转录窗口为静音，跳过")
+                else:
+                    prompt = self.text_separator.join(partial.texts) or None
+                    text = self.run_whisper(audio_np, prompt=prompt)
+                    if text:
+                        partial.texts.append(text)
+                        self.logger.info(f"增量转录结果: {text}")
+            except Exception as e:
+                self.logger.error(f"增量转录失败: {e}")
+            partial.committed = end
+    
+    def pcm_to_float32(self, pcm, out=None):
+        """将int16 PCM转换为Whisper使用的float32音频，out足够大时直接写入其中并返回视图"""
+        if out is None or out.size < pcm.size:
+            out = np.empty(pcm.size, dtype=np.float32)
+        else:
+            out = out[:pcm.size]
+        # 转换与缩放在一次乘法中完成，结果直接写入预分配的缓冲区
+        np.multiply(pcm, PCM_SCALE, out=out, dtype=np.float32, casting='unsafe')
+        return out
+    
+    def is_silent(self, audio_np):
+        """音量过低视为静音"""
+        rms = float(np.sqrt(np.dot(audio_np, audio_np) / audio_np.size))
+        return rms < self.silence_threshold
+    
+    def transcribe_audio(self, pcm, partial=None):
+        """转录音频数据，partial为录音期间已完成的增量转录"""
         try:
             self.logger.info("正在转录音频...")
             
-            # 将音频数据转换为numpy数组
-            audio_bytes = b''.join(audio_data)
-            audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-            
             # 检查音频长度
-            if len(audio_np) < self.RATE * 0.5:  # 至少0.5秒
+            if len(pcm) < self.RATE * 0.5:  # 至少0.5秒
                 self.logger.warning("录音时间太短，无法转录")
                 return None
                 
-            self.logger.info(f"音频数据长度: {len(audio_np)} 样本")
+            self.logger.info(f"音频数据长度: {len(pcm)} 样本")
             
-            # 使用Whisper进行转录
-            result = self.model.transcribe(
-                audio_np,
-                language=self.source_language,
-                fp16=False  # 使用float32确保稳定性
-            )
+            # 等待增量转录完成，只转录剩余部分
+            texts = []
+            if partial:
+                partial.thread.join()
+                texts.extend(partial.texts)
+                pcm = pcm[partial.committed:]
             
-            original_text = result.get('text', '').strip()
+            if pcm.size:
+                # 将音频数据转换为numpy数组
+                audio_np = self.pcm_to_float32(pcm, self.audio_buffer)
+                
+                # 音量过低视为静音，跳过转录
+                if self.is_silent(audio_np):
+                    self.logger.info("录音音量过低，跳过转录")
+                else:
+                    # 使用Whisper进行转录
+                    prompt = self.text_separator.join(texts) or None
+                    text = self.run_whisper(audio_np, prompt=prompt)
+                    if text:
+                        texts.append(text)
+            
+            original_text = self.text_separator.join(texts)
             self.logger.info(f"原始转录结果: {original_text}")
             
-            # 如果转录结果不为空，进行语义修正
-            if original_text:
-                corrected_text = self.semantic_correction(original_text)
-                self.logger.info(f"语义修正后: {corrected_text}")
-                return corrected_text
-            else:
-                return None
+            # 语义修正与翻译合并在同一次请求中完成
+            return original_text or None
             
         except Exception as e:
             self.logger.error(f"转录失败: {e}")
             return None
     
-    def semantic_correction(self, text):
-        """使用AI进行语义修正，纠正语音识别错误"""
-        try:
-            if not text or len(text.strip()) < 2:  # 太短的文本不需要修正
-                return text
-                
-            self.logger.info("正在进行语义修正...")
-            
-            # 构建语义修正提示
-            prompt = f"""请对以下语音识别结果进行语义修正，纠正可能的识别错误，使其更符合自然语言表达。
-当前语境为vrchat游戏内聊天如果该文本语义没有问题，则直接返回原文本，不做任何修改。
-要求：
-1. 保持原意不变
-2. 修正语法错误和错别字
-3. 使文本更通顺自然
-4. 只返回修正后的文本，不要添加任何解释
-
-需要修正的文本：{text}"""
-
-            response = self.openai_client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "你是一个专业的文本修正助手，专门用于纠正语音识别错误。"},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.1  # 使用较低的温度确保稳定性
-            )
+    def run_whisper(self, audio_np, prompt=None):
+        """使用当前后端转录float32音频，返回文本；prompt为之前已转录的上文"""
+        # 增量转录线程与翻译线程共用同一个模型，串行执行
+        with self.model_lock:
+            if self.whisper_backend == "faster-whisper":
+                segments, _ = self.model.transcribe(audio_np, language=self.source_language, initial_prompt=prompt)
+                return "".join(segment.text for segment in segments).strip()
             
-            corrected_text = response.choices[0].message.content.strip()
-            
-            # 如果修正后的文本与原始文本相同，或者修正失败，返回原始文本
-            if not corrected_text or corrected_text == text:
-                self.logger.info("语义修正无变化，使用原始文本")
-                return text
-                
-            self.logger.info(f"语义修正完成: {text} -> {corrected_text}")
-            return corrected_text
-            
-        except Exception as e:
-            self.logger.error(f"语义修正失败: {e}")
-            self.logger.info("语义修正失败，使用原始文本")
-            return text  # 如果修正失败，返回原始文本
+            result = self.model.transcribe(
+                audio_np,
+                language=self.source_language,
+                initial_prompt=prompt,
+                fp16=self.use_fp16  # CUDA上使用fp16，CPU上使用float32
+            )
+            return result.get('text', '').strip()
     
-    def translate_text(self, text, target_language):
+    async def translate_text_async(self, text, target_language):
         """翻译文本到指定语言"""
         try:
             if not text:
@@ -404,7 +649,7 @@ class VRChatTranslator:
             # 构建翻译提示
             prompt = f"请将以下{self.source_language}文本翻译成{target_language}，只返回翻译结果，不要添加任何解释：\n\n{text}"
             
-            response = self.openai_client.chat.completions.create(
+            response = await self.async_openai_client.chat.completions.create(
                 model=self.model_name,
                 messages=[
                     {"role": "system", "content": "你是一个专业的翻译助手。"},
@@ -422,41 +667,126 @@ class VRChatTranslator:
             self.logger.error(f"翻译到 {target_language} 失败: {e}")
             return ""
     
-    def process_translation_queue(self):
-        """处理翻译队列"""
-        while True:
-            try:
-                audio_data = self.translation_queue.get(timeout=1)
-                if audio_data is None:  # 退出信号
-                    break
+    async def correct_and_translate_async(self, text):
+        """语义修正并翻译到所有目标语言，相同文本复用缓存或正在进行的请求"""
+        cached = self.translation_cache.get(text)
+        if cached:
+            self.translation_cache.move_to_end(text)
+            self.logger.info(f"使用缓存的翻译结果: {text}")
+            return cached
+        
+        # 相同文本的请求正在进行时等待同一个结果
+        task = self.pending_translations.get(text)
+        if task is None:
+            task = asyncio.ensure_future(self.request_correct_and_translate_async(text))
+            self.pending_translations[text] = task
+            task.add_done_callback(lambda _: self.pending_translations.pop(text, None))
+        result = await task
+        
+        # 只缓存所有目标语言都翻译成功的结果
+        if len(result[1]) == len(self.target_languages):
+            self.translation_cache[text] = result
+            self.translation_cache.move_to_end(text)
+            if len(self.translation_cache) > self.translation_cache_size:
+                self.translation_cache.popitem(last=False)
+        return result
+    
+    async def request_correct_and_translate_async(self, text):
+        """一次请求完成语义修正并翻译到所有目标语言，返回 (修正后文本, 翻译结果)"""
+        if not text:
+            return text, {}
+        
+        languages = self.target_languages
+        corrected_text = text
+        translations = {}
+        try:
+            self.logger.info(f"正在进行语义修正并翻译到 {', '.join(languages)}...")
+            
+            # 构建语义修正 + 多语言翻译提示，要求以JSON返回
+            example = json.dumps({"corrected": "...", **{lang: "..." for lang in languages}}, ensure_ascii=False)
+            prompt = f"""以下是一段{self.source_language}语音识别结果，当前语境为vrchat游戏内聊天。
+1. 先对其进行语义修正，纠正可能的识别错误、语法错误和错别字，保持原意不变；如果语义没有问题，则保留原文本
+2. 再将修正后的文本分别翻译成{', '.join(languages)}
+以严格的JSON格式返回，"corrected"为修正后的文本，其余键为语言代码，值为翻译结果，不要添加任何解释。格式：{example}
+
+语音识别结果：{text}"""
+            
+            response = await self.async_openai_client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": "你是一个专业的翻译助手，同时负责纠正语音识别错误。"},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1000 * len(languages),
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
+            
+            result = json.loads(response.choices[0].message.content)
+            
+            corrected = result.get("corrected")
+            if isinstance(corrected, str) and corrected.strip():
+                corrected_text = corrected.strip()
+                if corrected_text != text:
+                    self.logger.info(f"语义修正完成: {text} -> {corrected_text}")
+            
+            for lang in languages:
+                translated_text = result.get(lang)
+                if isinstance(translated_text, str) and translated_text.strip():
+                    translations[lang] = translated_text.strip()
+                    self.logger.info(f"{lang}翻译结果: {translations[lang]}")
                     
-                self.is_translating = True
+        except Exception as e:
+            self.logger.error(f"语义修正与翻译失败: {e}")
+        
+        # 批量结果中缺失的语言逐个并发翻译
+        missing = [lang for lang in languages if lang not in translations]
+        if missing:
+            self.logger.warning(f"以下语言单独翻译: {', '.join(missing)}")
+            results = await asyncio.gather(*(self.translate_text_async(corrected_text, lang) for lang in missing))
+            for lang, translated_text in zip(missing, results):
+                if translated_text:
+                    translations[lang] = translated_text
+        
+        # 保持目标语言的配置顺序
+        return corrected_text, {lang: translations[lang] for lang in languages if lang in translations}
+    
+    def submit_utterance(self, pcm, partial=None):
+        """将一段录音提交到翻译事件循环处理"""
+        sequence = next(self.utterance_counter)
+        asyncio.run_coroutine_threadsafe(self.handle_utterance(pcm, partial, sequence), self.loop)
+    
+    async def handle_utterance(self, pcm, partial, sequence):
+        """处理一段录音：转录、语义修正与翻译、发送到VRChat"""
+        try:
+            # 转录在专用线程中串行执行，不阻塞事件循环上其他录音的翻译请求
+            original_text = await self.loop.run_in_executor(self.transcribe_executor, self.transcribe_audio, pcm, partial)
+            
+            if original_text:
+                # 先发送转录原文，翻译完成后再用完整结果更新对话框；缓存命中时直接发送结果
+                if original_text not in self.translation_cache:
+                    self.send_utterance_output(sequence, original_text)
                 
-                # 转录音频
-                original_text = self.transcribe_audio(audio_data)
+                # 语义修正并翻译到所有目标语言
+                original_text, translations = await self.correct_and_translate_async(original_text)
                 
-                if original_text:
-                    # 翻译到所有目标语言
-                    translations = {}
-                    for lang in self.target_languages:
-                        translated_text = self.translate_text(original_text, lang)
-                        if translated_text:
-                            translations[lang] = translated_text
-                    
-                    # 构建输出格式
-                    output_text = self.format_output(translations, original_text)
-                    
-                    # 发送到VRChat
-                    self.send_to_vrchat(output_text)
+                # 构建输出格式
+                output_text = self.format_output(translations, original_text)
                 
-                self.is_translating = False
-                self.translation_queue.task_done()
+                # 发送到VRChat
+                self.send_utterance_output(sequence, output_text)
                 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.logger.error(f"处理翻译队列时出错: {e}")
-                self.is_translating = False
+        except Exception as e:
+            self.logger.error(f"处理录音时出错: {e}")
+    
+    def send_utterance_output(self, sequence, text):
+        """按录音顺序发送到VRChat，丢弃比已发送内容更早的录音结果"""
+        # 只在事件循环线程中调用，无需加锁
+        if sequence < self.last_sent_sequence:
+            self.logger.info(f"已有更新的录音结果，丢弃过期输出: {text}")
+            return
+        self.last_sent_sequence = sequence
+        self.send_to_vrchat(text)
     
     def format_output(self, translations, original_text):
         """格式化输出文本"""
@@ -492,8 +822,11 @@ class VRChatTranslator:
             self.logger.error(f"发送到VRChat失败: {e}")
     
     def start_translation_worker(self):
-        """启动翻译工作线程"""
-        self.translation_worker = threading.Thread(target=self.process_translation_queue)
+        """启动翻译事件循环线程"""
+        # 每段录音在同一个事件循环中作为独立任务处理，异步客户端的连接池在多次翻译间复用
+        self.loop = asyncio.new_event_loop()
+        self.transcribe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+        self.translation_worker = threading.Thread(target=self.loop.run_forever)
         self.translation_worker.daemon = True
         self.translation_worker.start()
         self.logger.info("翻译工作线程已启动")
@@ -502,9 +835,16 @@ class VRChatTranslator:
         """按键按下事件"""
         try:
             # 检查快捷键
-            if hasattr(key, 'char') and key.char and key.char.lower() == self.hotkey_char:
+            if key in self.hotkey_keys:
                 self.hotkey_pressed = True
-                if not self.is_recording and not self.is_translating:
+                if self.is_recording:
+                    # 防抖时间内再次按下，继续当前录音
+                    if self.resume_recording():
+                        self.logger.info(f"{self.hotkey_char.upper()} 键再次按下，继续录音")
+                    else:
+                        # 等锁期间录音可能刚被停止，此时开始新录音；仍在录音时(按键自动重复)不做任何事
+                        self.start_recording()
+                else:
                     self.logger.info(f"检测到 {self.hotkey_char.upper()} 键，开始录音")
                     self.start_recording()
                 
@@ -515,7 +855,7 @@ class VRChatTranslator:
         """按键释放事件"""
         try:
             # 检查快捷键释放
-            if hasattr(key, 'char') and key.char and key.char.lower() == self.hotkey_char:
+            if key in self.hotkey_keys:
                 self.hotkey_pressed = False
                 if self.is_recording:
                     self.logger.info(f"{self.hotkey_char.upper()} 键释放，停止录音")
@@ -540,15 +880,39 @@ class VRChatTranslator:
         self.logger.info("应用正在后台运行...")
         
         # 启动键盘监听
-        with Listener(on_press=self.on_press, on_release=self.on_release) as listener:
-            listener.join()
+        listener = Listener(on_press=self.on_press, on_release=self.on_release)
+        listener.start()
+        try:
+            # 带超时等待，Windows上无超时的join无法被Ctrl+C中断
+            while listener.is_alive():
+                listener.join(0.5)
+        finally:
+            listener.stop()
     
     def cleanup(self):
-        """清理资源"""
+        """清理资源，可在初始化未完成时调用，重复调用无副作用"""
         if self.audio:
             self.audio.terminate()
-        # 发送退出信号到翻译队列
-        self.translation_queue.put(None)
+            self.audio = None
+        # 关闭HTTP连接并停止翻译事件循环
+        if self.loop:
+            if self.http_client:
+                try:
+                    asyncio.run_coroutine_threadsafe(self.http_client.aclose(), self.loop).result(timeout=5)
+                except Exception as e:
+                    self.logger.warning(f"关闭HTTP客户端失败: {e}")
+                self.http_client = None
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
+        if self.transcribe_executor:
+            self.transcribe_executor.shutdown(wait=False)
+            self.transcribe_executor = None
+        # 写完队列中剩余的日志
+        if self.log_listener:
+            self.log_listener.stop()
+            for handler in self.log_listener.handlers:
+                handler.close()
+            self.log_listener = None
 
 def main():
     """主函数"""